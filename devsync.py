@@ -1,16 +1,52 @@
 #!/usr/bin/env python3
 """devsync - Bidirectional dev environment sync over SSH."""
 
-import argparse
-import json
+import functools
 import os
-import socket
-import subprocess
 import sys
+import time
+
+# Heavier modules (socket, subprocess, json, argparse, re, ...) are imported
+# in the functions that need them so `devsync help`/`list` start quickly.
+# Regexes are compiled on first use for the same reason.
+
+
+@functools.lru_cache(maxsize=1)
+def _json_backend():
+    """Return (loads, dumps) using orjson when installed, else stdlib json.
+
+    Both write 2-space indented UTF-8 with a trailing newline.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        def dumps(obj):
+            return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode()
+
+        return json.loads, dumps
+
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+    return orjson.loads, dumps
+
+
+def _loads(data):
+    return _json_backend()[0](data)
+
+
+def _dumps(obj):
+    return _json_backend()[1](obj)
+
 
 CONFIG_DIR = os.path.expanduser("~/.config/devsync")
 GLOBAL_PROFILES_FILE = os.path.join(CONFIG_DIR, "profiles.json")
 LOCAL_PROFILES_FILE = "devsync.json"
+PTR_CACHE_FILE = os.path.join(CONFIG_DIR, "ptr_cache.json")
+PTR_CACHE_TTL = 15 * 60
+INVENTORY_DIR = os.path.join(CONFIG_DIR, "inventory")
 
 DEFAULT_EXCLUDES = [
     ".git", "node_modules", "__pycache__", ".venv", "venv",
@@ -18,6 +54,7 @@ DEFAULT_EXCLUDES = [
 ]
 
 
+@functools.lru_cache(maxsize=1)
 def profiles_file():
     if os.path.exists(LOCAL_PROFILES_FILE):
         return LOCAL_PROFILES_FILE
@@ -25,28 +62,57 @@ def profiles_file():
 
 
 def load_profiles():
-    path = profiles_file()
-    if not os.path.exists(path):
+    try:
+        with open(profiles_file(), "rb") as f:
+            return _loads(f.read())
+    except FileNotFoundError:
         return {}
-    with open(path) as f:
-        return json.load(f)
 
 
 def save_profiles(profiles, local=False):
-    if local or os.path.exists(LOCAL_PROFILES_FILE):
+    path = profiles_file()
+    if local:
         path = LOCAL_PROFILES_FILE
-    else:
+    elif path == GLOBAL_PROFILES_FILE:
         os.makedirs(CONFIG_DIR, exist_ok=True)
-        path = GLOBAL_PROFILES_FILE
-    with open(path, "w") as f:
-        json.dump(profiles, f, indent=2, sort_keys=True)
-        f.write("\n")
-
-
-def build_rsync_cmd(src, dst, excludes, dry_run=False):
-    cmd = ["rsync", "-avz", "--delete"]
+    with open(path, "wb") as f:
+        f.write(_dumps(profiles))
+    if path != profiles_file():
+        # Just created ./devsync.json, which now takes priority
+        profiles_file.cache_clear()
+
+
+CONTROL_DIR = os.path.expanduser("~/.ssh/controlmasters")
+
+# On a LAN rsync-over-ssh is CPU-bound on compression, not the network:
+# skip compression at both layers. The cipher is left to ssh and the user's
+# ssh_config (a command-line -c would override any Ciphers set there).
+# ControlMaster keeps the first connection open for 5 minutes so a
+# status/push/status sequence only pays for one TCP + SSH handshake.
+# %C hashes user/host/port, keeping the socket path under the length limit;
+# ssh expands the ~ itself, which keeps spaces in $HOME out of rsync's -e.
+SSH_CMD = (
+    "ssh -T -o Compression=no -o ControlMaster=auto"
+    " -o ControlPath=~/.ssh/controlmasters/devsync-%C -o ControlPersist=300"
+)
+
+
+def build_rsync_cmd(src, dst, excludes, dry_run=False, compress=False, itemize=False,
+                    files_from=None):
+    # ssh won't create the ControlPath directory itself
+    os.makedirs(CONTROL_DIR, mode=0o700, exist_ok=True)
+    cmd = ["rsync", "-av", "-e", SSH_CMD]
+    if files_from:
+        # -a doesn't imply -r with --files-from, and --delete needs -r
+        cmd.extend(["--from0", f"--files-from={files_from}"])
+    else:
+        cmd.append("--delete")
+    if compress:
+        cmd.append("-z")
     if dry_run:
         cmd.append("-n")
+    if itemize:
+        cmd.extend(["-i", "--out-format=%i %n"])
     for pattern in excludes:
         cmd.extend(["--exclude", pattern])
     cmd.extend([src, dst])
@@ -57,6 +123,11 @@ def ensure_trailing_slash(path):
     return path if path.endswith("/") else path + "/"
 
 
+def _remote_url(profile):
+    """Return the profile's rsync remote as "host:path/"."""
+    return f"{profile['host']}:{profile['remote_path'].rstrip('/')}/"
+
+
 GREEN = "\033[32m"
 RED = "\033[31m"
 YELLOW = "\033[33m"
@@ -66,29 +137,57 @@ DIM = "\033[2m"
 RESET = "\033[0m"
 
 
+# First word of rsync's non-file lines -> (color, marker)
+_RSYNC_LINE_STYLES = {
+    "deleting": (RED, "- "),
+    "sending": (DIM, ""),
+    "receiving": (DIM, ""),
+    "sent": (DIM, ""),
+    "total": (DIM, ""),
+    "building": (DIM, ""),
+}
+
+
 def colorize_rsync_line(line):
-    if line.startswith("deleting "):
-        return f"{RED}- {line}{RESET}"
-    if line.startswith("sending ") or line.startswith("receiving "):
-        return f"{DIM}{line}{RESET}"
-    if line.startswith("sent ") or line.startswith("total "):
-        return f"{DIM}{line}{RESET}"
-    if line == "" or line.startswith("building file list"):
+    head, sep, _ = line.partition(" ")
+    style = _RSYNC_LINE_STYLES.get(head) if sep else None
+    if style:
+        color, marker = style
+        return f"{color}{marker}{line}{RESET}"
+    if line == "":
         return f"{DIM}{line}{RESET}"
     if line.endswith("/"):
         return f"{DIM}  {line}{RESET}"
     return f"{GREEN}+ {line}{RESET}"
 
 
-def run_rsync(cmd):
+def run_rsync(cmd, classify=None):
+    """Run rsync, streaming colorized output as it arrives.
+
+    If `classify` is given, each stdout line is passed to it instead of
+    being printed, so the caller can bucket and render lines itself.
+    """
+    import subprocess
+    import threading
+
     print(f"  {YELLOW}{' '.join(cmd)}{RESET}\n")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    for line in result.stdout.splitlines():
-        print(colorize_rsync_line(line))
-    if result.stderr:
-        for line in result.stderr.splitlines():
-            print(f"{RED}{line}{RESET}")
-    return result.returncode
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1,
+    )
+    # Drain stderr in the background so a chatty rsync can't fill the pipe
+    # and stall while we're streaming stdout.
+    errors = []
+    err_reader = threading.Thread(target=lambda: errors.extend(proc.stderr))
+    err_reader.start()
+    for line in proc.stdout:
+        if classify:
+            classify(line.rstrip("\n"))
+        else:
+            print(colorize_rsync_line(line.rstrip("\n")), flush=True)
+    err_reader.join()
+    for line in errors:
+        print(f"{RED}{line.rstrip()}{RESET}")
+    return proc.wait()
 
 
 def cmd_init(args):
@@ -103,15 +202,18 @@ def cmd_init(args):
     if args.exclude:
         excludes.extend(args.exclude)
 
+    # save_profiles writes keys in insertion order, so keep both the
+    # profile table and each profile's fields sorted here
     profiles[name] = {
+        "compress": args.compress,
+        "excludes": excludes,
         "host": args.host,
-        "remote_path": args.remote,
         "local_path": args.local,
-        "excludes": excludes,
+        "remote_path": args.remote,
     }
+    profiles = dict(sorted(profiles.items()))
     save_profiles(profiles, local=args.local_config)
-    where = LOCAL_PROFILES_FILE if args.local_config or os.path.exists(LOCAL_PROFILES_FILE) else GLOBAL_PROFILES_FILE
-    print(f"Profile '{name}' created in {where}")
+    print(f"Profile '{name}' created in {profiles_file()}")
     return 0
 
 
@@ -122,16 +224,191 @@ def get_profile(profiles, name):
     return profiles[name]
 
 
+def _glob_to_re(glob):
+    """Translate an rsync glob to a regex: * and ? stop at /, ** doesn't."""
+    import re
+
+    out = []
+    i = 0
+    while i < len(glob):
+        c = glob[i]
+        if glob.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[" and "]" in glob[i + 2:]:
+            end = glob.index("]", i + 2)
+            body = glob[i + 1:end]
+            if body[0] == "!":
+                body = "^" + body[1:]
+            out.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end + 1
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def _compile_excludes(patterns):
+    """Fold rsync exclude patterns into one regex over relative paths.
+
+    Match it against the path relative to the sync root, with a trailing
+    slash for directories. Follows rsync's rules: a trailing / matches only
+    directories, a leading / anchors at the root, and any other pattern
+    matches the end of the path at a component boundary.
+    """
+    import re
+
+    parts = []
+    for p in patterns:
+        dir_only = p.endswith("/")
+        p = p.rstrip("/")
+        if not p:
+            continue
+        prefix = "" if p.startswith("/") else "(?:.*/)?"
+        parts.append(prefix + _glob_to_re(p.lstrip("/")) + ("/" if dir_only else "/?"))
+    if not parts:
+        return re.compile(r"(?!)")
+    return re.compile("(?s:" + "|".join(f"(?:{p})" for p in parts) + r")\Z")
+
+
+def _walk_local(root, excludes):
+    """Yield (relpath, DirEntry) under root, skipping excluded paths.
+
+    Directories are yielded with a trailing slash and a None entry.
+    """
+    exclude_re = _compile_excludes(excludes)
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            it = os.scandir(os.path.join(root, rel_dir))
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                rel = rel_dir + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if exclude_re.match(rel + "/"):
+                        continue
+                    stack.append(rel + "/")
+                    yield rel + "/", None
+                elif not exclude_re.match(rel):
+                    yield rel, entry
+
+
+def _build_inventory(local_path, excludes):
+    """Snapshot local_path as {relpath: [size, mtime_ns]} (dirs map to None).
+
+    Only metadata is recorded; rsync's own quick check decides what to send.
+    """
+    inventory = {}
+    for rel, entry in _walk_local(os.path.expanduser(local_path), excludes):
+        if entry is None:
+            inventory[rel] = None
+            continue
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        inventory[rel] = [st.st_size, st.st_mtime_ns]
+    return inventory
+
+
+def _diff_inventory(old, new):
+    """Return (changed, deleted) paths between two inventories.
+
+    Any size or mtime change counts: even a content-identical touch has to
+    reach rsync, or the remote keeps the old mtime and status never settles.
+    """
+    changed = []
+    for path, meta in new.items():
+        if path not in old:
+            changed.append(path)
+        elif meta is not None and meta[:2] != old[path][:2]:
+            changed.append(path)
+    deleted = [path for path in old if path not in new]
+    return changed, deleted
+
+
+def _inventory_file(name):
+    return os.path.join(INVENTORY_DIR, f"{name}.json")
+
+
+def _load_inventory(name, profile):
+    """Return the files last pushed for this profile, or None if unknown."""
+    import json
+
+    try:
+        with open(_inventory_file(name)) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # A changed destination or exclude list means the remote may not match
+    if any(data.get(k) != profile[k] for k in ("host", "remote_path", "local_path", "excludes")):
+        return None
+    return data["files"]
+
+
+def _save_inventory(name, profile, files):
+    import json
+
+    os.makedirs(INVENTORY_DIR, exist_ok=True)
+    data = {k: profile[k] for k in ("host", "remote_path", "local_path", "excludes")}
+    data["files"] = files
+    path = _inventory_file(name)
+    with open(path + ".tmp", "w") as f:
+        json.dump(data, f)
+    os.replace(path + ".tmp", path)
+
+
 def cmd_push(args):
     profile = get_profile(load_profiles(), args.name)
     if not profile:
         return 1
 
     src = ensure_trailing_slash(profile["local_path"])
-    dst = f"{profile['host']}:{ensure_trailing_slash(profile['remote_path'])}"
+    dst = _remote_url(profile)
+    excludes = profile["excludes"]
+    compress = profile.get("compress", False)
+
+    previous = None if args.full else _load_inventory(args.name, profile)
+    inventory = _build_inventory(profile["local_path"], excludes)
+    changed, deleted = _diff_inventory(previous or {}, inventory)
+
+    # Deletions need a full --delete run; otherwise send only what changed
+    # since the last push and skip rsync's scan of the whole tree.
+    if previous is not None and not deleted and not changed:
+        print(f"{BOLD}{CYAN}Pushing{RESET} {src} -> {dst}")
+        print(f"{DIM}  nothing changed since last push (use --full to force){RESET}")
+        rc = 0
+    elif previous is not None and not deleted:
+        print(f"{BOLD}{CYAN}Pushing{RESET} {src} -> {dst} ({len(changed)} changed)")
+        import tempfile
+
+        with tempfile.NamedTemporaryFile("w", suffix=".devsync", delete=False) as f:
+            f.write("\0".join(p.rstrip("/") for p in changed))
+        try:
+            rc = run_rsync(build_rsync_cmd(
+                src, dst, excludes, compress=compress, files_from=f.name,
+            ))
+        finally:
+            os.unlink(f.name)
+    else:
+        print(f"{BOLD}{CYAN}Pushing{RESET} {src} -> {dst}")
+        rc = run_rsync(build_rsync_cmd(src, dst, excludes, compress=compress))
 
-    print(f"{BOLD}{CYAN}Pushing{RESET} {src} -> {dst}")
-    return run_rsync(build_rsync_cmd(src, dst, profile["excludes"]))
+    if rc == 0:
+        try:
+            _save_inventory(args.name, profile, inventory)
+        except OSError:
+            pass
+    return rc
 
 
 def cmd_pull(args):
@@ -139,11 +416,32 @@ def cmd_pull(args):
     if not profile:
         return 1
 
-    src = f"{profile['host']}:{ensure_trailing_slash(profile['remote_path'])}"
+    src = _remote_url(profile)
     dst = ensure_trailing_slash(profile["local_path"])
 
     print(f"{BOLD}{CYAN}Pulling{RESET} {src} -> {dst}")
-    return run_rsync(build_rsync_cmd(src, dst, profile["excludes"]))
+    return run_rsync(build_rsync_cmd(src, dst, profile["excludes"], compress=profile.get("compress", False)))
+
+
+def classify_itemized(line):
+    """Map one line of an itemized local -> remote dry run to (push, pull).
+
+    Each side is the line plain `rsync -v` would print for that direction,
+    or None. A --delete mirror is symmetric: files new on local would be
+    deleted by a pull, remote files deleted by a push would be created by
+    a pull, and files that differ would be sent either way.
+    """
+    if line.startswith("*deleting"):
+        path = line[len("*deleting"):].strip()
+        return f"deleting {path}", path
+    code, _, path = line.partition(" ")
+    # Skips rsync's headers/summary and attribute-only changes ('.' prefix).
+    # Itemize codes are 11 chars on rsync 3.x and 9 on macOS' 2.6.9.
+    if not 9 <= len(code) <= 11 or code[0] not in "<>ch" or not path:
+        return None, None
+    if set(code[2:]) == {"+"}:
+        return path, f"deleting {path}"
+    return path, path
 
 
 def cmd_status(args):
@@ -152,75 +450,279 @@ def cmd_status(args):
         return 1
 
     local = ensure_trailing_slash(profile["local_path"])
-    remote = f"{profile['host']}:{ensure_trailing_slash(profile['remote_path'])}"
+    remote = _remote_url(profile)
+
+    # One itemized dry run describes both directions, saving a second SSH
+    # handshake and a second walk of both trees.
+    cmd = build_rsync_cmd(
+        local, remote, profile["excludes"], dry_run=True,
+        compress=profile.get("compress", False), itemize=True,
+    )
+    to_push = []
+    to_pull = []
+
+    def classify(line):
+        push, pull = classify_itemized(line)
+        if push:
+            to_push.append(push)
+        if pull:
+            to_pull.append(pull)
 
-    print(f"{BOLD}{CYAN}=== Changes to push (local -> remote) ==={RESET}")
-    rc1 = run_rsync(build_rsync_cmd(local, remote, profile["excludes"], dry_run=True))
+    rc = run_rsync(cmd, classify=classify)
 
-    print(f"\n{BOLD}{CYAN}=== Changes to pull (remote -> local) ==={RESET}")
-    rc2 = run_rsync(build_rsync_cmd(remote, local, profile["excludes"], dry_run=True))
+    for title, lines in (
+        ("Changes to push (local -> remote)", to_push),
+        ("Changes to pull (remote -> local)", to_pull),
+    ):
+        print(f"{BOLD}{CYAN}=== {title} ==={RESET}")
+        for line in lines:
+            print(colorize_rsync_line(line))
+        if not lines:
+            print(f"{DIM}  no changes{RESET}")
+        print()
+    return rc
 
-    return rc1 or rc2
+
+@functools.lru_cache(maxsize=1)
+def _known_hosts_rsa_re():
+    """hostnames keytype key [comment]; keytype may be e.g. ssh-rsa-cert-v01@openssh.com"""
+    import re
+
+    return re.compile(rb"(?m)^[ \t]*([^#\s]\S*)[ \t]+(\S*ssh-rsa\S*)[ \t]+\S")
 
 
 def parse_known_hosts():
     """Parse ~/.ssh/known_hosts and return RSA entries as a list of dicts."""
+    import mmap
+
     known_hosts = os.path.expanduser("~/.ssh/known_hosts")
-    if not os.path.exists(known_hosts):
-        return []
     entries = []
-    with open(known_hosts) as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            parts = line.split()
-            if len(parts) < 3:
-                continue
-            hostnames, keytype, key_b64 = parts[0], parts[1], parts[2]
-            if "ssh-rsa" not in keytype:
-                continue
-            # hostnames can be comma-separated (e.g. "host,1.2.3.4")
-            for h in hostnames.split(","):
-                h = h.strip("[]")  # bracketed [host]:port form
-                entries.append({"host": h, "keytype": keytype})
+    try:
+        with open(known_hosts, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return entries
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for m in _known_hosts_rsa_re().finditer(mm):
+                    keytype = m.group(2).decode("utf-8", errors="replace")
+                    # hostnames can be comma-separated (e.g. "host,1.2.3.4")
+                    for h in m.group(1).split(b","):
+                        h = h.strip(b"[]")  # bracketed [host]:port form
+                        entries.append({"host": h.decode("utf-8", errors="replace"), "keytype": keytype})
+    except FileNotFoundError:
+        pass
     return entries
 
 
-def probe_ssh(host, port=22, timeout=0.5):
-    """Try to connect to an SSH port and grab the banner."""
+PROBE_WORKERS = 64
+DNS_TIMEOUT = 2.0
+PROBE_BATCH_MAX = 256
+
+
+def _probe_batch_size():
+    """How many probe sockets to hold open at once, given the fd limit.
+
+    Leaves room for stdio, the selector, and one socket per DNS worker
+    still running in scan's forward and PTR pools (macOS' default soft
+    limit is 256).
+    """
+    try:
+        import resource
+    except ImportError:
+        return 128
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        return PROBE_BATCH_MAX
+    return max(1, min(PROBE_BATCH_MAX, soft - 2 * PROBE_WORKERS - 32))
+
+
+def _is_ip_literal(host):
+    import ipaddress
+
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+def resolve_addr(host, port=22):
+    """Resolve host to every (family, sockaddr) pair to try; [] if it fails."""
+    import socket
+
+    try:
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except (socket.gaierror, OSError):
+        return []
+    addrs = []
+    for family, _, _, _, sockaddr in infos:
+        if (family, sockaddr) not in addrs:
+            addrs.append((family, sockaddr))
+    return addrs
+
+
+def probe_ssh_hosts(targets, timeout=0.5):
+    """Grab SSH banners from many hosts at once with non-blocking sockets.
+
+    `targets` is a list of (host, addrs) pairs, addrs as returned by
+    resolve_addr(). Every address is probed, like create_connection trying
+    each result, and the host counts as reachable if any of them answers.
+    Each address gets `timeout` seconds to accept the connection and another
+    `timeout` to send its banner. Returns (host, banner) tuples in input
+    order; banner is None if the host is unreachable. Sockets are
+    opened in batches sized to the fd limit; running out of fds entirely
+    raises instead of reporting hosts as unreachable.
+
+    These are raw TCP probes, so they neither use nor warm the rsync
+    ControlMaster connections.
+    """
+    import errno
+    import selectors
+    import socket
+
+    banners = [None] * len(targets)
+    probes = [(i, addr) for i, (_, addrs) in enumerate(targets) for addr in addrs]
+    batch = _probe_batch_size()
+    next_i = 0
+    while next_i < len(probes):
+        sel = selectors.DefaultSelector()
+        deadlines = {}
+
+        def drop(s):
+            sel.unregister(s)
+            s.close()
+            del deadlines[s]
+
+        try:
+            start = time.monotonic()
+            while next_i < len(probes) and len(deadlines) < batch:
+                target_i, (family, sockaddr) = probes[next_i]
+                try:
+                    s = socket.socket(family, socket.SOCK_STREAM)
+                except OSError as e:
+                    # Out of fds locally: probe what's open, then retry
+                    # this address in the next batch rather than call it down
+                    if e.errno in (errno.EMFILE, errno.ENFILE):
+                        if not deadlines:
+                            raise
+                        break
+                    next_i += 1
+                    continue
+                s.setblocking(False)
+                err = s.connect_ex(sockaddr)
+                if err not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    s.close()
+                    next_i += 1
+                    continue
+                sel.register(s, selectors.EVENT_WRITE, target_i)
+                deadlines[s] = start + timeout
+                next_i += 1
+
+            while deadlines:
+                wait = max(0.0, min(deadlines.values()) - time.monotonic())
+                for key, events in sel.select(wait):
+                    s, i = key.fileobj, key.data
+                    if events & selectors.EVENT_WRITE:
+                        # Connect finished; wait for the banner if it succeeded
+                        if s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR):
+                            drop(s)
+                        else:
+                            sel.modify(s, selectors.EVENT_READ, i)
+                            deadlines[s] = time.monotonic() + timeout
+                        continue
+                    try:
+                        banner = s.recv(256).decode("utf-8", errors="replace").strip()
+                    except OSError:
+                        banner = None
+                    if banner:
+                        banners[i] = banner
+                    drop(s)
+                now = time.monotonic()
+                for s in [s for s, d in deadlines.items() if d <= now]:
+                    drop(s)
+        finally:
+            for s in list(deadlines):
+                drop(s)
+            sel.close()
+    return [(host, banner) for (host, _), banner in zip(targets, banners)]
+
+
+def resolve_ptr(host):
+    """Reverse-resolve an IP, returning its hostname or None."""
+    import socket
+
     try:
-        with socket.create_connection((host, port), timeout=timeout) as s:
-            banner = s.recv(256).decode("utf-8", errors="replace").strip()
-            return banner
-    except (OSError, socket.timeout):
+        name, _, _ = socket.gethostbyaddr(host)
+        return name
+    except (socket.herror, socket.gaierror, OSError):
         return None
 
 
+def _load_ptr_cache():
+    """Load the reverse-DNS cache as {ip: [name, timestamp]}."""
+    import json
+
+    try:
+        with open(PTR_CACHE_FILE) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    # Drop anything that isn't [name-or-null, timestamp]
+    return {
+        ip: entry for ip, entry in data.items()
+        if isinstance(entry, list) and len(entry) == 2
+        and (entry[0] is None or isinstance(entry[0], str))
+        and isinstance(entry[1], (int, float)) and not isinstance(entry[1], bool)
+    }
+
+
+def _save_ptr_cache(cache):
+    import json
+
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+    tmp = PTR_CACHE_FILE + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(cache, f)
+    os.replace(tmp, PTR_CACHE_FILE)
+
+
+@functools.lru_cache(maxsize=1)
+def _arp_res():
+    """Return (ip_re, skip_re) for parsing `arp -a` output."""
+    import re
+
+    # macOS: host (ip) at mac on iface ...
+    # Linux: host (ip) at mac [ether] on iface
+    ip_re = re.compile(r"\(((?:\d{1,3}\.){3}\d{1,3})\)")
+    # Multicast and broadcast addresses never run SSH
+    skip_re = re.compile(r"^(?:224|255)\.|\.255$")
+    return ip_re, skip_re
+
+
 def discover_lan_hosts():
     """Use arp table to find hosts on the local network with SSH open."""
+    import subprocess
+
     try:
         result = subprocess.run(
             ["arp", "-a"], capture_output=True, text=True, timeout=30,
         )
     except FileNotFoundError:
         return []
+    ip_re, skip_re = _arp_res()
     hosts = []
-    for line in result.stdout.splitlines():
-        # macOS: host (ip) at mac on iface ...
-        # Linux: host (ip) at mac [ether] on iface
-        paren_start = line.find("(")
-        paren_end = line.find(")")
-        if paren_start == -1 or paren_end == -1:
-            continue
-        ip = line[paren_start + 1:paren_end]
-        if ip.startswith("224.") or ip.startswith("255.") or ip.endswith(".255"):
-            continue
-        hosts.append(ip)
+    for m in ip_re.finditer(result.stdout):
+        ip = m.group(1)
+        if not skip_re.search(ip):
+            hosts.append(ip)
     return hosts
 
 
 def cmd_scan(args):
+    from concurrent.futures import ThreadPoolExecutor
+    from concurrent.futures import TimeoutError as FutureTimeout
+
     profiles = load_profiles()
 
     # Collect IPs to check: profile hosts + known_hosts RSA entries
@@ -236,15 +738,66 @@ def cmd_scan(args):
         return 0
 
     print("Checking trusted hosts...\n")
+    hosts = sorted(hosts_to_check)
+
+    # PTR records rarely change, so only look up hosts without a fresh
+    # cache entry. Failed lookups are cached too since those are the slow ones.
+    now = time.time()
+    ptr_cache = {
+        ip: entry for ip, entry in _load_ptr_cache().items()
+        if now - entry[1] <= PTR_CACHE_TTL
+    }
+    ptr_misses = [ip for ip in hosts if ip not in ptr_cache]
+
+    # DNS lookups block in the libc resolver, so run them in threads and
+    # stop waiting after DNS_TIMEOUT. Forward and PTR lookups get separate
+    # pools and deadlines so hung PTR queries can't starve the forward ones,
+    # and IP literals skip DNS entirely. The SSH probes themselves are
+    # multiplexed on this thread while PTR lookups finish in their pool.
+    def wait_for(future, deadline, default):
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeout:
+            return default
+
+    timed_out = object()
+    names = [h for h in hosts if not _is_ip_literal(h)]
+    addrs = {h: resolve_addr(h) for h in hosts if h not in names}
+    fwd_ex = ThreadPoolExecutor(max_workers=max(1, min(PROBE_WORKERS, len(names))))
+    ptr_ex = ThreadPoolExecutor(max_workers=max(1, min(PROBE_WORKERS, len(ptr_misses))))
+    try:
+        fwd_deadline = time.monotonic() + DNS_TIMEOUT
+        fwd_futures = {h: fwd_ex.submit(resolve_addr, h) for h in names}
+        ptr_deadline = time.monotonic() + DNS_TIMEOUT
+        ptr_futures = {ip: ptr_ex.submit(resolve_ptr, ip) for ip in ptr_misses}
+        for h, f in fwd_futures.items():
+            addrs[h] = wait_for(f, fwd_deadline, timed_out)
+        banners = dict(probe_ssh_hosts(
+            [(h, addrs[h]) for h in hosts if addrs[h] is not timed_out]
+        ))
+        for ip, f in ptr_futures.items():
+            ptr_cache[ip] = [wait_for(f, ptr_deadline, None), now]
+    finally:
+        # Don't block on lookups that are still hung past the deadline
+        fwd_ex.shutdown(wait=False)
+        ptr_ex.shutdown(wait=False)
+
+    if ptr_misses:
+        try:
+            _save_ptr_cache(ptr_cache)
+        except OSError:
+            pass
+
     reachable = []
     unreachable = []
-    for ip in sorted(hosts_to_check):
-        banner = probe_ssh(ip)
-        try:
-            name, _, _ = socket.gethostbyaddr(ip)
-            label = f"{ip} ({name})" if name != ip else ip
-        except (socket.herror, socket.gaierror, OSError):
-            label = ip
+    for ip in hosts:
+        name = ptr_cache[ip][0]
+        label = f"{ip} ({name})" if name and name != ip else ip
+        if addrs[ip] is timed_out:
+            # Unknown, not unreachable: never offer to rewrite these
+            print(f"  {YELLOW}{label}  DNS lookup timed out{RESET}")
+            continue
+        banner = banners[ip]
         if banner:
             print(f"  {GREEN}{label}  SSH: {banner}{RESET}")
             reachable.append(ip)
@@ -332,12 +885,18 @@ Examples:
   Save profile locally (easy to edit with vim):
     devsync init myproject --host user@10.0.0.20 --remote /path --local /path --local-config
 
+  Compress transfers for a host over a slow link (off by default for LAN speed):
+    devsync init myproject --host user@example.com --remote /path --local /path --compress
+
   Overwrite an existing profile:
     devsync init myproject --host user@10.0.0.20 --remote /path --local /path --force
 
   Push local changes to the remote machine:
     devsync push myproject
 
+  Push everything, even files unchanged since the last push:
+    devsync push myproject --full
+
   Pull remote changes to the local machine:
     devsync pull myproject
 
@@ -405,7 +964,21 @@ def cmd_remove(args):
     return 0
 
 
+# Subcommands that take no arguments skip building the argparse tree
+NO_ARG_COMMANDS = {
+    "help": cmd_help,
+    "list": cmd_list,
+    "scan": cmd_scan,
+}
+
+
 def main():
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0] in NO_ARG_COMMANDS:
+        return NO_ARG_COMMANDS[argv[0]](None)
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="devsync",
         description="Bidirectional dev environment sync over SSH",
@@ -420,12 +993,14 @@ def main():
     p_init.add_argument("--local", required=True, help="Local path")
     p_init.add_argument("--exclude", action="append", help="Additional exclude pattern")
     p_init.add_argument("--force", action="store_true", help="Overwrite existing profile")
+    p_init.add_argument("--compress", action="store_true", help="Compress transfers (for slow or WAN links)")
     p_init.add_argument("--local-config", action="store_true", help="Save profile to ./devsync.json instead of global config")
     p_init.set_defaults(func=cmd_init)
 
     # push
     p_push = sub.add_parser("push", help="Sync local -> remote")
     p_push.add_argument("name", help="Profile name")
+    p_push.add_argument("--full", action="store_true", help="Ignore the last-push inventory and sync the whole tree")
     p_push.set_defaults(func=cmd_push)
 
     # pull